@@ -24,9 +24,9 @@ source .venv/bin/activate || source ./.venv/bin/activate
 echo "Installing dependencies..."
 uv pip install -e ".[dev]"
 
-# Generate proto files
+# Generate proto files against the freshly installed protobuf runtime
 echo "Generating gRPC code..."
-python -m src.proto.build_proto
+python -m src.proto.build_proto --force
 
 # Generate lock file
 echo "Generating lock file..."
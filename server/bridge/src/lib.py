@@ -1,51 +1,158 @@
+import asyncio
 import logging
-import json
+import itertools
 import uuid
 import grpc
+import orjson
 from typing import Any
 from google.protobuf.struct_pb2 import Struct
-from google.protobuf.json_format import ParseDict
 from result import Ok, Err, Result
-from pydian import get
 
 # Import the generated gRPC code
 # Note: run build_proto.py first to generate these modules
 from src.proto import bridge_message_pb2 as pb2
 from src.proto import bridge_message_pb2_grpc as pb2_grpc
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger("portico-bridge")
 
+# Retry calls that fail with UNAVAILABLE (engine restarting, connection reset)
+# with exponential backoff, handled inside gRPC itself. Lone and batched signals
+# are retried alike; either may be replayed if the engine handled it before the
+# connection dropped
+_RETRIED_METHODS = (
+    "InitServer",
+    "ProcessSignal",
+    "ProcessSignalBatch",
+    "CreateAgent",
+    "DeleteAgent",
+)
+_RETRY_SERVICE_CONFIG = orjson.dumps(
+    {
+        "methodConfig": [
+            {
+                "name": [
+                    {"service": "portico.BridgeService", "method": method}
+                    for method in _RETRIED_METHODS
+                ],
+                "retryPolicy": {
+                    "maxAttempts": 4,
+                    "initialBackoff": "0.1s",
+                    "maxBackoff": "2s",
+                    "backoffMultiplier": 2,
+                    "retryableStatusCodes": ["UNAVAILABLE"],
+                },
+            }
+        ]
+    }
+).decode()
+
+# Must match the engine's decoding limit in `RpcServer::with_server`
+_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+# Keep the engine channel's HTTP/2 connection warm between signals so bursts
+# don't pay a fresh TCP + HTTP/2 handshake after an idle period
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10000),
+    # Large agent records and SYNC results shouldn't trip the 4 MiB default
+    ("grpc.max_send_message_length", _MAX_MESSAGE_BYTES),
+    ("grpc.max_receive_message_length", _MAX_MESSAGE_BYTES),
+    ("grpc.enable_retries", 1),
+    # Give every channel in the client's pool its own connection instead of
+    # sharing one through the global subchannel pool
+    ("grpc.use_local_subchannel_pool", 1),
+    ("grpc.service_config", _RETRY_SERVICE_CONFIG),
+]
+
+# Enum name -> value tables, resolved once instead of per signal
+_SIGNAL_TYPES = dict(pb2.SignalType.items())
+_SYNC_SCOPES = dict(pb2.SyncScope.items())
+
+# Shared read-only default for missing nested payload sections
+_EMPTY: dict[str, Any] = {}
+
+# Constant request, built once and never mutated
+_SERVER_INIT_REQUEST = pb2.ServerInitRequest(server_init=True)
+
 
 # Helper function to convert Python dict to Protobuf Struct
 def dict_to_struct(data: dict[str, Any]) -> Struct:
     """Convert a Python dictionary to a Protobuf Struct"""
+    # `Struct.update` fills the fields directly instead of going through the
+    # reflection-based json_format parser
     struct = Struct()
-    ParseDict(data, struct)
+    struct.update(data)
     return struct
 
 
+def _log_runtime_session(signal_request: Any, response: Any) -> None:
+    """Log the runtime_session_uuid of a signal response, if present"""
+    if response is not None and response.runtime_session_uuid:
+        logger.debug(
+            "Received runtime_session_uuid for signal %s: %s",
+            signal_request.signal_id,
+            response.runtime_session_uuid,
+        )
+
+        # In a real implementation, you might want to update the database with this UUID
+        # to link the signal with the runtime session
+        # Example: update_signal_with_rts_id(signal_request.signal_id, response.runtime_session_uuid)
+
+
 # gRPC client class
 class BridgeClient:
     """gRPC client for communicating with the engine service"""
 
-    def __init__(self, host: str, port: int):
+    __slots__ = (
+        "host",
+        "port",
+        "pool_size",
+        "channel",
+        "stub",
+        "_channels",
+        "_stubs",
+        "_process_signal_calls",
+        "_rr",
+    )
+
+    def __init__(self, host: str, port: int, pool_size: int = 4):
         self.host = host
         self.port = port
+        self.pool_size = max(1, pool_size)
+        # `channel`/`stub` are the first pool slot, used for server init and
+        # agent create/delete. Those calls come from concurrent event workers,
+        # so sharing a channel does not order them
         self.channel: grpc.aio.Channel | None = None
         self.stub: pb2_grpc.BridgeServiceStub | None = None
+        self._channels: list[grpc.aio.Channel] = []
+        self._stubs: list[pb2_grpc.BridgeServiceStub] = []
+        # Bound `ProcessSignal` callables, one per pool slot, looked up once
+        self._process_signal_calls: list[Any] = []
+        self._rr = itertools.count()
 
     async def connect(self) -> bool:
         """Connect to the gRPC server"""
         try:
-            # Create an insecure channel
+            # Create a pool of insecure channels, each with its own connection
             address = f"{self.host}:{self.port}"
-            self.channel = grpc.aio.insecure_channel(address)
-            self.stub = pb2_grpc.BridgeServiceStub(self.channel)
-            logger.info(f"Created gRPC channel to {address}")
+            self._channels = [
+                # Signals are small, already-compact protobuf; pin compression
+                # off so no CPU goes into gzipping them
+                grpc.aio.insecure_channel(
+                    address,
+                    options=_CHANNEL_OPTIONS,
+                    compression=grpc.Compression.NoCompression,
+                )
+                for _ in range(self.pool_size)
+            ]
+            self._stubs = [pb2_grpc.BridgeServiceStub(c) for c in self._channels]
+            self._process_signal_calls = [s.ProcessSignal for s in self._stubs]
+            self.channel = self._channels[0]
+            self.stub = self._stubs[0]
+            logger.info(f"Created {self.pool_size} gRPC channel(s) to {address}")
             return True
         except Exception as e:
             logger.error(f"Failed to connect to gRPC server: {e}")
@@ -57,87 +164,159 @@ class BridgeClient:
             if not self.stub:
                 logger.error("gRPC stub not initialized")
                 return None
-            # Use pb2 namespace to access the generated classes
-            request = pb2.ServerInitRequest(server_init=True)
-            response = await self.stub.InitServer(request)
+            response = await self.stub.InitServer(_SERVER_INIT_REQUEST)
             return response
         except Exception as e:
             logger.error(f"Error initializing server: {e}")
             return None
 
+    def _next_slot(self) -> int | None:
+        """Pick a pool slot round-robin, or None when there is no pool
+
+        The slot indexes both `_stubs` and `_process_signal_calls`.
+        """
+        if not self._stubs:
+            return None
+        return next(self._rr) % len(self._stubs)
+
+    def _next_stub(self) -> Any:
+        """Pick a stub round-robin across the channel pool"""
+        slot = self._next_slot()
+        return self.stub if slot is None else self._stubs[slot]
+
     async def process_signal(self, signal_request: Any) -> Any:
         """Send a signal request to the engine"""
         try:
             if not self.stub:
                 logger.error("gRPC stub not initialized")
                 return None
-            response = await self.stub.ProcessSignal(signal_request)
-
-            # Log the runtime_session_uuid if present
-            if (
-                response
-                and hasattr(response, "runtime_session_uuid")
-                and response.runtime_session_uuid
-            ):
-                logger.info(
-                    f"Received runtime_session_uuid: {response.runtime_session_uuid}"
-                )
-
-                # In a real implementation, you might want to update the database with this UUID
-                # to link the signal with the runtime session
-                # Example: update_signal_with_rts_id(signal_request.signal_id, response.runtime_session_uuid)
-
+            slot = self._next_slot()
+            process_signal = (
+                self.stub.ProcessSignal
+                if slot is None
+                else self._process_signal_calls[slot]
+            )
+            response = await process_signal(signal_request)
+            _log_runtime_session(signal_request, response)
             return response
         except Exception as e:
             logger.error(f"Error processing signal: {sanitize_data(str(e))}")
             return None
 
+    async def process_signal_batch(self, signal_requests: list[Any]) -> Any:
+        """Stream several signal requests to the engine in one call"""
+        try:
+            if not self.stub:
+                logger.error("gRPC stub not initialized")
+                return None
+            return await self._next_stub().ProcessSignalBatch(iter(signal_requests))
+        except Exception as e:
+            logger.error(f"Error processing signal batch: {sanitize_data(str(e))}")
+            return None
+
     async def send_signal(self, data: dict[str, Any], meta: str = "signal") -> bool:
         """Send a signal to the engine using the unified SignalRequest structure"""
         try:
             # Handle the server init case separately
             if "server-init" in data:
                 response = await self.initialize_server()
-                return response is not None and getattr(response, "success", False)
+                return response is not None and response.success
 
             # Process the actual signal based on the data
             signal_request = await create_signal_request(data)
             if signal_request:
                 response = await self.process_signal(signal_request)
-                if response and getattr(response, "success", False):
+                if response is not None and response.success:
                     logger.info(
-                        f"Successfully sent {meta} message: {sanitize_data(getattr(response, 'message', ''))}"
+                        "Successfully sent %s %s (agent %s): %s",
+                        meta,
+                        signal_request.signal_id,
+                        signal_request.agent_id,
+                        sanitize_data(response.message),
                     )
                     return True
                 else:
                     error_msg = (
-                        getattr(response, "message", "No response received")
-                        if response
+                        response.message
+                        if response is not None
                         else "No response received"
                     )
                     logger.error(f"Failed to send {meta} message: {error_msg}")
                     return False
             else:
                 logger.error(
-                    f"Failed to create signal request from data: {sanitize_data(data)}"
+                    "Failed to create signal request from data: %s", _Sanitized(data)
                 )
                 return False
         except Exception as e:
             logger.error(f"Error sending message to engine: {sanitize_data(str(e))}")
             return False
 
+    async def send_signal_batch(self, batch: list[dict[str, Any]]) -> list[bool]:
+        """Send several signals to the engine over a single streaming RPC
+
+        Returns one result per payload, in order.
+        """
+        results = [False] * len(batch)
+        positions = []
+        signal_requests = []
+        for position, data in enumerate(batch):
+            signal_request = await create_signal_request(data)
+            if signal_request is None:
+                logger.error(
+                    "Failed to create signal request from data: %s", _Sanitized(data)
+                )
+            else:
+                positions.append(position)
+                signal_requests.append(signal_request)
+        if not signal_requests:
+            return results
+
+        batch_response = await self.process_signal_batch(signal_requests)
+        if batch_response is None:
+            logger.error("Failed to send signal batch: No response received")
+            return results
+
+        # The engine answers every request, in request order
+        responses = batch_response.responses
+        if len(responses) != len(signal_requests):
+            logger.error(
+                "Engine answered %d of %d batched signals",
+                len(responses),
+                len(signal_requests),
+            )
+        for position, signal_request, response in zip(
+            positions, signal_requests, responses
+        ):
+            _log_runtime_session(signal_request, response)
+            if response.success:
+                logger.info(
+                    "Successfully sent signal %s (agent %s): %s",
+                    signal_request.signal_id,
+                    signal_request.agent_id,
+                    sanitize_data(response.message),
+                )
+                results[position] = True
+            else:
+                logger.error(
+                    "Failed to send signal %s: %s",
+                    signal_request.signal_id,
+                    sanitize_data(response.message),
+                )
+        return results
+
     async def close(self):
-        """Close the gRPC channel"""
-        if self.channel:
-            await self.channel.close()
-            logger.info("Closed gRPC channel")
+        """Close the gRPC channels"""
+        if self._channels:
+            await asyncio.gather(*(c.close() for c in self._channels))
+            logger.info("Closed gRPC channels")
 
 
 async def create_signal_request(data: dict[str, Any]) -> Any:
     """Create a SignalRequest from the Supabase payload"""
     try:
-        # Extract record data from the Supabase payload using pydian get
-        record = get(data, "data.record", {})
+        # Extract record data from the Supabase payload
+        record = (data.get("data") or _EMPTY).get("record") or _EMPTY
 
         if not record:
             logger.error("No record found in data payload")
@@ -145,58 +324,68 @@ async def create_signal_request(data: dict[str, Any]) -> Any:
 
         # Extract the necessary fields from the record
         # Get the signal ID directly from the record
-        signal_id = get(record, "id", 0)
+        signal_id = record.get("id") or 0
 
         # Get the agent ID directly from the record
-        agent_id = get(record, "agent_id", 0)
+        agent_id = record.get("agent_id") or 0
 
         if agent_id:
-            logger.info(f"Processing signal for agent_id: {agent_id}")
+            logger.debug("Processing signal for agent_id: %s", agent_id)
         else:
             logger.warning("No agent_id found in record")
 
         # Determine signal type
-        signal_type_str = get(record, "signal_type", "").upper()
+        signal_type_str = (record.get("signal_type") or "").upper()
         if not signal_type_str:
             logger.error("No signal_type found in record")
             return None
 
-        try:
-            # Access via the pb2 namespace
-            signal_type = pb2.SignalType.Value(signal_type_str)
-        except ValueError:
+        signal_type = _SIGNAL_TYPES.get(signal_type_str)
+        if signal_type is None:
             logger.error(f"Invalid signal_type: {signal_type_str}")
             return None
 
         # Extract initial_data JSON
-        initial_data = get(record, "initial_data", {})
-        if isinstance(initial_data, str):
-            try:
-                initial_data = json.loads(initial_data)
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON in initial_data: {initial_data}")
-                initial_data = {}
-
-        # Create the base request via pb2 namespace using the correct field names
-        request = pb2.SignalRequest(
-            signal_id=signal_id,
-            agent_id=agent_id,
-            signal_type=signal_type,
-        )
-
-        # Handle payload based on signal type - access via pb2 namespace
-        if signal_type == pb2.SignalType.RUN:
-            # Ensure the run_data has the expected structure with a "data" field
-            # that the Rust engine is looking for
-            run_data_wrapper = {"data": initial_data}
-            request.run_data.CopyFrom(dict_to_struct(run_data_wrapper))
-        elif signal_type == pb2.SignalType.SYNC:
-            sync_payload = create_sync_payload(initial_data)
-            request.sync.CopyFrom(sync_payload)
-        elif signal_type == pb2.SignalType.FYI:
-            # Wrap fyi_data in a similar structure for consistency
-            fyi_data_wrapper = {"data": initial_data}
-            request.fyi_data.CopyFrom(dict_to_struct(fyi_data_wrapper))
+        initial_data = record.get("initial_data") or {}
+
+        # Create the request via pb2 namespace using the correct field names;
+        # the payload is built straight into the request rather than built
+        # separately and copied in with `CopyFrom`
+        if signal_type == pb2.SignalType.SYNC:
+            # The sync payload is built field by field, so it needs the decoded dict
+            if isinstance(initial_data, str):
+                try:
+                    initial_data = orjson.loads(initial_data)
+                except orjson.JSONDecodeError:
+                    logger.error(f"Invalid JSON in initial_data: {initial_data}")
+                    initial_data = {}
+            request = pb2.SignalRequest(
+                signal_id=signal_id,
+                agent_id=agent_id,
+                signal_type=signal_type,
+                sync=create_sync_payload(initial_data),
+            )
+        elif isinstance(initial_data, str):
+            # Already-serialized JSON is forwarded as-is: the engine decodes it
+            # once, instead of us parsing it and rebuilding it as a Struct
+            request = pb2.SignalRequest(
+                signal_id=signal_id,
+                agent_id=agent_id,
+                signal_type=signal_type,
+                raw_json_data=initial_data.encode(),
+            )
+        else:
+            request = pb2.SignalRequest(
+                signal_id=signal_id,
+                agent_id=agent_id,
+                signal_type=signal_type,
+            )
+            # Ensure run_data/fyi_data have the expected structure with a
+            # "data" field that the Rust engine is looking for
+            if signal_type == pb2.SignalType.RUN:
+                request.run_data.update({"data": initial_data})
+            elif signal_type == pb2.SignalType.FYI:
+                request.fyi_data.update({"data": initial_data})
 
         return request
     except Exception as e:
@@ -207,73 +396,115 @@ async def create_signal_request(data: dict[str, Any]) -> Any:
 def create_sync_payload(data: dict[str, Any]) -> Any:
     """Create a SyncPayload from the initial_data"""
     # Get sync scope
-    scope_str = get(data, "scope", "ALL").upper()
-    try:
-        # Access via pb2 namespace
-        scope = pb2.SyncScope.Value(scope_str)
-    except ValueError:
+    scope_str = (data.get("scope") or "ALL").upper()
+    scope = _SYNC_SCOPES.get(scope_str)
+    if scope is None:
         logger.error(f"Invalid scope: {scope_str}")
-        # Default via pb2 namespace
         scope = pb2.SyncScope.ALL
 
-    # Get entity UUIDs
-    entity_uuids = [str(uuid_val) for uuid_val in get(data, "entity_uuids", [])]
-
-    # Get entity types
-    entity_types_str = get(data, "entity_types", [])
-    entity_types = []
-    for et_str in entity_types_str:
-        try:
-            # Access via pb2 namespace
-            et = pb2.EntityType.Value(et_str.upper())
-            entity_types.append(et)
-        except ValueError:
-            logger.error(f"Invalid entity_type: {et_str}")
+    # Get the UUIDs to sync; Supabase already hands these over as strings, so
+    # only non-str values (e.g. uuid.UUID) get converted. `entity_uuids` is the
+    # older name for the same list
+    uuids = data.get("agent_uuids") or data.get("entity_uuids") or ()
+    agent_uuids = [v if type(v) is str else str(v) for v in uuids]
 
     # Create and return via pb2 namespace
-    return pb2.SyncPayload(
-        scope=scope, entity_uuids=entity_uuids, entity_types=entity_types
-    )
+    return pb2.SyncPayload(scope=scope, agent_uuids=agent_uuids)
+
+
+def is_handled_signal(data: dict[str, Any]) -> bool:
+    """Check whether a Supabase signal payload has a signal_type we process"""
+    record = (data.get("data") or _EMPTY).get("record") or _EMPTY
+    signal_type = record.get("signal_type")
+    return isinstance(signal_type, str) and signal_type.upper() in _SIGNAL_TYPES
 
 
 # Sanitize data by removing null characters that Postgres can't handle
 def sanitize_data(data: Any) -> Any:
     """Sanitize data by removing null characters that Postgres can't handle."""
+    if isinstance(data, str):
+        return data.replace("\u0000", "") if "\u0000" in data else data
+    elif isinstance(data, (dict, list)):
+        # Almost no payload contains a null character, so check the whole
+        # structure with one C-level serialization and skip the rebuild
+        try:
+            if b"\\u0000" not in orjson.dumps(data):
+                return data
+        except TypeError:
+            # Not JSON-serializable (e.g. non-string keys); walk it instead
+            pass
+        return _strip_nulls(data)
+    return data
+
+
+def _strip_nulls(data: Any) -> Any:
+    """Recursively rebuild `data` with null characters removed from strings"""
     if isinstance(data, str):
         return data.replace("\u0000", "")
     elif isinstance(data, dict):
-        return {k: sanitize_data(v) for k, v in data.items()}
+        return {k: _strip_nulls(v) for k, v in data.items()}
     elif isinstance(data, list):
-        return [sanitize_data(v) for v in data]
+        return [_strip_nulls(v) for v in data]
     return data
 
 
+class _Sanitized:
+    """Log argument that sanitizes `data` only if the record is actually emitted"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    def __str__(self) -> str:
+        return str(sanitize_data(self.data))
+
+
 # Public API for the bridge service
 async def handle_signal_insert(payload: dict[str, Any], client: BridgeClient) -> None:
     """Handle a new signal inserted into the signals table"""
-    # Sanitize the payload before any processing
-    safe_payload = sanitize_data(payload)
-    logger.info(f"🔔 New signal detected: {safe_payload}")
+    logger.debug("🔔 New signal detected: %s", _Sanitized(payload))
 
     try:
-        # Send sanitized signal to engine
-        success = await client.send_signal(safe_payload, "signal")
+        # Send signal to engine
+        success = await client.send_signal(payload, "signal")
         if not success:
             logger.error("Failed to process signal in engine service")
     except Exception as e:
         logger.error(f"Error handling new signal: {str(e)}")
 
 
+async def handle_signal_batch(
+    payloads: list[dict[str, Any]], client: BridgeClient
+) -> None:
+    """Handle a burst of signals coalesced from the signals table"""
+    # A lone signal keeps the unary path and its per-signal logging
+    if len(payloads) == 1:
+        await handle_signal_insert(payloads[0], client)
+        return
+
+    logger.debug("🔔 %d new signals detected", len(payloads))
+    try:
+        results = await client.send_signal_batch(payloads)
+        failed = results.count(False)
+        if failed:
+            logger.error(
+                "Failed to process %d of %d signals in engine service",
+                failed,
+                len(results),
+            )
+    except Exception as e:
+        logger.error(f"Error handling signal batch: {str(e)}")
+
+
 async def handle_agent_insert(payload: dict[str, Any], client: BridgeClient) -> None:
     """Handles a new Agent inserted in postgres"""
     # Create and send a `CreateAgentRequest`
     try:
-        # Sanitize the payload before any processing
-        safe_payload = sanitize_data(payload)
-        logger.info(f"🔔 New agent created: {safe_payload}")
+        logger.debug("🔔 New agent created: %s", _Sanitized(payload))
 
-        # Extract record data from the Supabase payload using pydian get
-        record = get(safe_payload, "data.record", {})
+        # Extract record data from the Supabase payload
+        record = (payload.get("data") or _EMPTY).get("record") or _EMPTY
 
         if not record:
             logger.error("No record found in agent insert payload")
@@ -284,20 +515,18 @@ async def handle_agent_insert(payload: dict[str, Any], client: BridgeClient) ->
             logger.error("gRPC stub not initialized")
             return
 
-        # Convert record to a Protobuf Struct
-        agent_json_struct = dict_to_struct(record)
-
-        # Create request
-        request = pb2.CreateAgentRequest(agent_json=agent_json_struct)
+        # Create request, filling the agent_json Struct in place
+        request = pb2.CreateAgentRequest()
+        request.agent_json.update(record)
 
         # Send request
         try:
             response = await client.stub.CreateAgent(request)
-            if response and response.success:
-                logger.info(f"Successfully created agent: {response.message}")
+            if response is not None and response.success:
+                logger.info("Successfully created agent: %s", response.message)
             else:
                 error_msg = (
-                    get(response, "message") if response else "No response received"
+                    response.message if response is not None else "No response received"
                 )
                 logger.error(f"Failed to create agent: {error_msg}")
         except Exception as e:
@@ -310,19 +539,17 @@ async def handle_agent_delete(payload: dict[str, Any], client: BridgeClient) ->
     """Handles a new Agent deleted in postgres"""
     # Create and send a `DeleteAgentRequest`
     try:
-        # Sanitize the payload before any processing
-        safe_payload = sanitize_data(payload)
-        logger.info(f"🔔 Agent deleted: {safe_payload}")
+        logger.debug("🔔 Agent deleted: %s", _Sanitized(payload))
 
-        # Extract record data from the Supabase payload using pydian get
-        record = get(safe_payload, "data.record", {})
+        # Extract record data from the Supabase payload
+        record = (payload.get("data") or _EMPTY).get("record") or _EMPTY
 
         if not record:
             logger.error("No record found in agent delete payload")
             return
 
         # Get the agent ID from the record
-        agent_id = get(record, "id", 0)
+        agent_id = record.get("id") or 0
         if not agent_id:
             logger.error("No agent ID found in delete record")
             return
@@ -338,11 +565,13 @@ async def handle_agent_delete(payload: dict[str, Any], client: BridgeClient) ->
         # Send request
         try:
             response = await client.stub.DeleteAgent(request)
-            if response and response.success:
-                logger.info(f"Successfully deleted agent: {response.message}")
+            if response is not None and response.success:
+                logger.info(
+                    "Successfully deleted agent %s: %s", agent_id, response.message
+                )
             else:
                 error_msg = (
-                    get(response, "message") if response else "No response received"
+                    response.message if response is not None else "No response received"
                 )
                 logger.error(f"Failed to delete agent: {error_msg}")
         except Exception as e:
@@ -24,38 +24,107 @@ So the flow is:
 
 import os
 import asyncio
+import functools
+import logging
 
 from signal import SIGINT, SIGTERM
 
 from supabase import create_async_client
 from dotenv import load_dotenv
+from google.protobuf.internal import api_implementation
 
 from src.lib import logger
 from src.lib import (
     BridgeClient,
-    handle_signal_insert,
+    handle_signal_batch,
     handle_agent_insert,
     handle_agent_delete,
+    is_handled_signal,
 )
 
 # Ensure proto files are generated
 from src.proto import build_proto
 
 
-async def shutdown(channel_list, stop_event, grpc_client):
-    """Handle graceful shutdown"""
-    logger.info("Shutting down...")
-    for channel in channel_list:
-        await channel.unsubscribe()
+# Defaults for the event worker pool; realtime events waiting for a worker
+# beyond the queue size are dropped, not buffered
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+DEFAULT_NUM_WORKERS = 16
 
-    # Close gRPC connection
-    if grpc_client:
-        await grpc_client.close()
+# Signal inserts are coalesced into batches of up to this many signals, waiting
+# at most this long after the first one arrives
+DEFAULT_SIGNAL_BATCH_SIZE = 64
+DEFAULT_SIGNAL_BATCH_DELAY_MS = 5
+
+
+def enqueue_event(queue, handler, payload):
+    """Queue a realtime event for the worker pool, shedding it if the queue is full"""
+    try:
+        queue.put_nowait((handler, payload))
+    except asyncio.QueueFull:
+        logger.error(f"Event queue full, dropping event for {handler.__name__}")
+
+
+async def event_worker(queue, grpc_client):
+    """Process queued realtime events one at a time"""
+    while True:
+        handler, payload = await queue.get()
+        try:
+            await handler(payload, grpc_client)
+        except Exception as e:
+            logger.error(f"Unhandled error in {handler.__name__}: {e}")
+        finally:
+            queue.task_done()
 
-    stop_event.set()
+
+def enqueue_signal(queue, payload):
+    """Queue a signal insert for the batcher, shedding it if the queue is full"""
+    # Rows we can't process never take a queue slot or reach protobuf
+    if not is_handled_signal(payload):
+        logger.warning("Ignoring signal with unhandled signal_type")
+        return
+    try:
+        queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        logger.error("Signal queue full, dropping signal")
+
+
+async def signal_batcher(signal_queue, event_queue, max_batch, max_delay):
+    """Coalesce queued signal inserts and hand each batch to the worker pool"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await signal_queue.get()]
+        deadline = loop.time() + max_delay
+        while len(batch) < max_batch:
+            # Take whatever is already queued before waiting on the timer
+            if not signal_queue.empty():
+                batch.append(signal_queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(signal_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        # Wait for room rather than dropping the whole batch on a full queue;
+        # signals keep piling up in `signal_queue` meanwhile
+        await event_queue.put((handle_signal_batch, batch))
 
 
 async def main():
+    # Run new tasks eagerly up to their first real suspension point (3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # Every signal is built and serialized as protobuf, which is many times
+    # slower on the pure-Python runtime than on upb
+    if api_implementation.Type() == "python":
+        logger.warning(
+            "protobuf is using the pure-Python implementation; "
+            "set PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=upb"
+        )
+
     # Load environment variables
     if not load_dotenv():
         raise RuntimeError(
@@ -67,6 +136,19 @@ async def main():
     supabase_key = os.getenv("SUPABASE_KEY")
     engine_host = os.getenv("ENGINE_CONTAINER_NAME", "engine")
     engine_port = int(os.getenv("ENGINE_PORT", "50051"))
+    engine_channels = int(os.getenv("ENGINE_CHANNEL_POOL_SIZE", "4"))
+    # A queue size of 0 would make the queues unbounded, and 0 workers would
+    # stall every event, so both are clamped to at least 1
+    event_queue_size = max(
+        1, int(os.getenv("EVENT_QUEUE_SIZE", str(DEFAULT_EVENT_QUEUE_SIZE)))
+    )
+    num_workers = max(1, int(os.getenv("EVENT_WORKERS", str(DEFAULT_NUM_WORKERS))))
+    signal_batch_size = int(
+        os.getenv("SIGNAL_BATCH_SIZE", str(DEFAULT_SIGNAL_BATCH_SIZE))
+    )
+    signal_batch_delay_ms = int(
+        os.getenv("SIGNAL_BATCH_DELAY_MS", str(DEFAULT_SIGNAL_BATCH_DELAY_MS))
+    )
 
     if not supabase_url or not supabase_key:
         logger.error("SUPABASE_URL and SUPABASE_KEY must be set in environment")
@@ -87,7 +169,7 @@ async def main():
         return
 
     # Connect to the engine service using gRPC
-    grpc_client = BridgeClient(engine_host, engine_port)
+    grpc_client = BridgeClient(engine_host, engine_port, pool_size=engine_channels)
     if not await grpc_client.connect():
         logger.error("Failed to connect to engine service via gRPC")
         return
@@ -100,15 +182,32 @@ async def main():
 
     logger.info(f"Successfully initialized engine service: {response.message}")
 
+    # Realtime callbacks only enqueue; a fixed pool of workers bounds how many
+    # events are in flight against the engine at once
+    event_queue = asyncio.Queue(maxsize=event_queue_size)
+    workers = [
+        asyncio.create_task(event_worker(event_queue, grpc_client))
+        for _ in range(num_workers)
+    ]
+    # Signal inserts go through a batcher first, so a bulk insert becomes a
+    # few streaming `ProcessSignalBatch` calls instead of one RPC per row
+    signal_queue = asyncio.Queue(maxsize=event_queue_size)
+    batcher = asyncio.create_task(
+        signal_batcher(
+            signal_queue,
+            event_queue,
+            max(1, signal_batch_size),
+            signal_batch_delay_ms / 1000,
+        )
+    )
+
     # Set up Supabase realtime subscriptions
     channel_signals = client.channel("signal-inserts")
 
     # Subscribe to changes on the `signals` table (only when added)
     channel_signals.on_postgres_changes(
         event="INSERT",
-        callback=lambda payload: asyncio.create_task(
-            handle_signal_insert(payload, grpc_client)
-        ),
+        callback=functools.partial(enqueue_signal, signal_queue),
         table="signals",
         schema="public",
     )
@@ -117,9 +216,7 @@ async def main():
     channel_agents = client.channel("agent-inserts")
     channel_agents.on_postgres_changes(
         event="INSERT",
-        callback=lambda payload: asyncio.create_task(
-            handle_agent_insert(payload, grpc_client)
-        ),
+        callback=functools.partial(enqueue_event, event_queue, handle_agent_insert),
         table="agents",
         schema="public",
     )
@@ -127,9 +224,7 @@ async def main():
     channel_agents_deletes = client.channel("agent-deletes")
     channel_agents_deletes.on_postgres_changes(
         event="DELETE",
-        callback=lambda payload: asyncio.create_task(
-            handle_agent_delete(payload, grpc_client)
-        ),
+        callback=functools.partial(enqueue_event, event_queue, handle_agent_delete),
         table="agents",
         schema="public",
     )
@@ -139,23 +234,40 @@ async def main():
     # Use asyncio.Event for cleaner termination
     stop_event = asyncio.Event()
 
-    # Set up signal handlers for graceful shutdown
+    # Set up signal handlers for graceful shutdown; they only flip the event,
+    # the actual teardown runs below once `main` wakes up
+    loop = asyncio.get_running_loop()
     for sig in (SIGINT, SIGTERM):
-        asyncio.get_event_loop().add_signal_handler(
-            sig,
-            lambda: asyncio.create_task(
-                shutdown(
-                    [channel_signals, channel_agents, channel_agents_deletes],
-                    stop_event,
-                    grpc_client,
-                )
-            ),
-        )
+        loop.add_signal_handler(sig, stop_event.set)
 
     logger.info("Portico bridge service started. Press Ctrl+C to exit.")
     await stop_event.wait()
+
+    logger.info("Shutting down...")
+    for channel in (channel_signals, channel_agents, channel_agents_deletes):
+        await channel.unsubscribe()
+
+    # Stop the batcher and workers; events still queued at this point are dropped
+    for task in (batcher, *workers):
+        task.cancel()
+    await asyncio.gather(batcher, *workers, return_exceptions=True)
+
+    # Close gRPC connection
+    await grpc_client.close()
     logger.info("Portico bridge service stopped")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Configure logging once, for the service process only
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        force=True,
+    )
+    # Prefer uvloop's libuv event loop; it isn't available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -49,6 +49,12 @@ class BridgeServiceStub(object):
             response_deserializer=bridge__message__pb2.SignalResponse.FromString,
             _registered_method=True,
         )
+        self.ProcessSignalBatch = channel.stream_unary(
+            "/portico.BridgeService/ProcessSignalBatch",
+            request_serializer=bridge__message__pb2.SignalRequest.SerializeToString,
+            response_deserializer=bridge__message__pb2.SignalBatchResponse.FromString,
+            _registered_method=True,
+        )
         self.CreateAgent = channel.unary_unary(
             "/portico.BridgeService/CreateAgent",
             request_serializer=bridge__message__pb2.CreateAgentRequest.SerializeToString,
@@ -78,6 +84,12 @@ class BridgeServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ProcessSignalBatch(self, request_iterator, context):
+        """Process a burst of signals over one client stream"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def CreateAgent(self, request, context):
         """Process changes"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -103,6 +115,11 @@ def add_BridgeServiceServicer_to_server(servicer, server):
             request_deserializer=bridge__message__pb2.SignalRequest.FromString,
             response_serializer=bridge__message__pb2.SignalResponse.SerializeToString,
         ),
+        "ProcessSignalBatch": grpc.stream_unary_rpc_method_handler(
+            servicer.ProcessSignalBatch,
+            request_deserializer=bridge__message__pb2.SignalRequest.FromString,
+            response_serializer=bridge__message__pb2.SignalBatchResponse.SerializeToString,
+        ),
         "CreateAgent": grpc.unary_unary_rpc_method_handler(
             servicer.CreateAgent,
             request_deserializer=bridge__message__pb2.CreateAgentRequest.FromString,
@@ -185,6 +202,36 @@ class BridgeService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def ProcessSignalBatch(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/portico.BridgeService/ProcessSignalBatch",
+            bridge__message__pb2.SignalRequest.SerializeToString,
+            bridge__message__pb2.SignalBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def CreateAgent(
         request,
@@ -1,77 +1,105 @@
 #!/usr/bin/env python
 """
 Build script to generate Python gRPC code from proto files.
-Run this script to regenerate the gRPC code after changes to the proto files.
+Run this script to regenerate the gRPC code after changes to the proto files;
+pass --force to regenerate even if the generated files look up to date.
 """
 
 import os
 import sys
-import subprocess
 import re
+from importlib.resources import files
 
 # Get the absolute path to the project root
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
 PROTO_PATH = os.path.join(REPO_ROOT, "server/proto")
 OUTPUT_PATH = os.path.join(REPO_ROOT, "server/bridge/src/proto")
 
+# Bare `import x_pb2 as ...` lines emitted by grpc_tools; anchored so already
+# rewritten `from src.proto import x_pb2 as ...` lines are left alone
+_IMPORT_RE = re.compile(r"^import (\w+)_pb2 as", re.MULTILINE)
+
 
 def fix_imports():
     """Fix imports in generated protobuf files."""
     print("Fixing imports in generated files...")
 
     # Fix imports in *_pb2_grpc.py files
-    for filename in os.listdir(OUTPUT_PATH):
-        if filename.endswith("_pb2_grpc.py"):
-            file_path = os.path.join(OUTPUT_PATH, filename)
+    with os.scandir(OUTPUT_PATH) as entries:
+        grpc_files = [
+            e for e in entries if e.name.endswith("_pb2_grpc.py") and e.is_file()
+        ]
+
+    for entry in grpc_files:
+        file_path = entry.path
+
+        # Read the file
+        with open(file_path, "r") as file:
+            content = file.read()
 
-            # Read the file
-            with open(file_path, "r") as file:
-                content = file.read()
+        # Replace imports
+        content = _IMPORT_RE.sub(r"from src.proto import \1_pb2 as", content)
 
-            # Replace imports
-            content = re.sub(
-                r"import (\w+)_pb2 as", r"from src.proto import \1_pb2 as", content
-            )
+        # Write back to file
+        with open(file_path, "w") as file:
+            file.write(content)
 
-            # Write back to file
-            with open(file_path, "w") as file:
-                file.write(content)
+        print(f"Fixed imports in {entry.name}")
 
-            print(f"Fixed imports in {filename}")
+
+def is_up_to_date(proto_file_paths):
+    """Check whether every generated file is newer than every proto file."""
+    with os.scandir(OUTPUT_PATH) as entries:
+        gen_mtimes = [
+            e.stat().st_mtime
+            for e in entries
+            if e.name.endswith(("_pb2.py", "_pb2_grpc.py")) and e.is_file()
+        ]
+    if not gen_mtimes:
+        return False
+    src_mtime = max(os.path.getmtime(p) for p in proto_file_paths)
+    return min(gen_mtimes) > src_mtime
 
 
-def generate_proto_code():
-    """Generate Python code from proto files."""
+def generate_proto_code(force=False):
+    """Generate Python code from proto files, unless it is already up to date."""
     print(f"Generating Python code from proto files in {PROTO_PATH}...")
 
     # Ensure the output directory exists
     os.makedirs(OUTPUT_PATH, exist_ok=True)
 
-    proto_files = [f for f in os.listdir(PROTO_PATH) if f.endswith(".proto")]
+    with os.scandir(PROTO_PATH) as entries:
+        proto_files = [e.name for e in entries if e.name.endswith(".proto")]
 
     if not proto_files:
         print("No proto files found!")
         return False
 
-    for proto_file in proto_files:
-        proto_file_path = os.path.join(PROTO_PATH, proto_file)
-        print(f"Processing {proto_file}...")
-
-        try:
-            cmd = [
-                "python",
-                "-m",
-                "grpc_tools.protoc",
-                f"--proto_path={PROTO_PATH}",
-                f"--python_out={OUTPUT_PATH}",
-                f"--grpc_python_out={OUTPUT_PATH}",
-                proto_file_path,
-            ]
-            subprocess.check_call(cmd)
-            print(f"Successfully generated code for {proto_file}")
-        except subprocess.CalledProcessError as e:
-            print(f"Error generating code for {proto_file}: {e}")
-            return False
+    proto_file_paths = [os.path.join(PROTO_PATH, f) for f in proto_files]
+    if not force and is_up_to_date(proto_file_paths):
+        print("Generated proto code is up to date, skipping protoc")
+        return True
+
+    # Imported here so that merely importing this module stays cheap
+    from grpc_tools import protoc
+
+    # Run protoc once, in-process, for all files; `grpc_tools.protoc.main`
+    # doesn't add the bundled well-known types (google/protobuf/*.proto) to
+    # the include path on its own
+    well_known_path = str(files("grpc_tools") / "_proto")
+    print(f"Processing {', '.join(proto_files)}...")
+
+    args = [
+        "grpc_tools.protoc",
+        f"--proto_path={PROTO_PATH}",
+        f"--proto_path={well_known_path}",
+        f"--python_out={OUTPUT_PATH}",
+        f"--grpc_python_out={OUTPUT_PATH}",
+        *proto_file_paths,
+    ]
+    if protoc.main(args) != 0:
+        print("Error generating code from proto files")
+        return False
 
     # Fix imports in generated files
     fix_imports()
@@ -81,6 +109,6 @@ def generate_proto_code():
 
 
 if __name__ == "__main__":
-    if not generate_proto_code():
+    if not generate_proto_code(force="--force" in sys.argv[1:]):
         sys.exit(1)
     sys.exit(0)
@@ -1,11 +1,18 @@
+import logging
 import uuid
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.lib import (
     BridgeClient,
+    _Sanitized,
     create_signal_request,
     create_sync_payload,
+    dict_to_struct,
+    handle_agent_delete,
+    handle_agent_insert,
+    is_handled_signal,
+    sanitize_data,
 )
 from src.proto import bridge_message_pb2 as pb2
 
@@ -175,3 +182,209 @@ async def test_bridge_client():
     # Verify the stub was called correctly
     mock_stub.InitServer.assert_called_once()
     mock_stub.ProcessSignal.assert_called_once_with(request)
+
+
+@pytest.mark.asyncio
+async def test_create_signal_request_json_string_initial_data():
+    """Test that a JSON-encoded initial_data string is forwarded without re-encoding"""
+    data = {
+        "data": {
+            "table": "signals",
+            "type": "INSERT",
+            "record": {
+                "id": 7,
+                "agent_id": 3,
+                "signal_type": "run",
+                "initial_data": '{"name": "Test Agent", "count": 2}',
+            },
+        }
+    }
+
+    request = await create_signal_request(data)
+
+    assert request is not None
+    assert request.signal_id == 7
+    assert request.agent_id == 3
+    assert request.signal_type == pb2.SignalType.RUN
+    assert request.WhichOneof("payload") == "raw_json_data"
+    assert request.raw_json_data == b'{"name": "Test Agent", "count": 2}'
+
+
+@pytest.mark.asyncio
+async def test_create_signal_request_invalid_signal_type():
+    """Test that an unknown signal_type is rejected"""
+    data = {"data": {"record": {"id": 1, "agent_id": 1, "signal_type": "BOGUS"}}}
+
+    assert await create_signal_request(data) is None
+
+
+def test_dict_to_struct_nested():
+    """Test that nested dicts, lists and nulls survive conversion"""
+    data = {
+        "name": "agent",
+        "count": 3,
+        "enabled": True,
+        "missing": None,
+        "tags": ["a", 1, {"deep": False}],
+        "config": {"retries": 2},
+    }
+
+    struct = dict_to_struct(data)
+
+    assert struct["name"] == "agent"
+    assert struct["count"] == 3
+    assert struct["enabled"] is True
+    assert struct["missing"] is None
+    assert struct["tags"][0] == "a"
+    assert struct["tags"][2]["deep"] is False
+    assert struct["config"]["retries"] == 2
+
+
+def test_sanitize_data_strips_null_characters():
+    """Test that null characters are removed from nested strings"""
+    data = {"record": {"name": "a\u0000b", "tags": ["x\u0000", "y"]}, "n": 1}
+
+    assert sanitize_data(data) == {"record": {"name": "ab", "tags": ["x", "y"]}, "n": 1}
+    assert sanitize_data("c\u0000d") == "cd"
+
+
+def test_sanitize_data_returns_clean_payload_unchanged():
+    """Test that payloads without null characters are not copied"""
+    data = {"record": {"name": "agent", "tags": ["x", "y"]}}
+
+    assert sanitize_data(data) is data
+
+
+@pytest.mark.asyncio
+async def test_bridge_client_round_robins_process_signal():
+    """Test that ProcessSignal calls rotate across the channel pool"""
+    client = BridgeClient("localhost", 50051, pool_size=3)
+    stubs = [AsyncMock() for _ in range(3)]
+    with patch("src.lib.pb2_grpc.BridgeServiceStub", side_effect=stubs):
+        assert await client.connect()
+    request = pb2.SignalRequest(signal_id=1, agent_id=1, signal_type=pb2.RUN)
+
+    for _ in range(6):
+        await client.process_signal(request)
+
+    assert [s.ProcessSignal.await_count for s in stubs] == [2, 2, 2]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_create_signal_request_payload_per_type():
+    """Test that each signal type sets only its own payload field"""
+
+    def payload(signal_type):
+        return {
+            "data": {
+                "record": {
+                    "id": 1,
+                    "agent_id": 2,
+                    "signal_type": signal_type,
+                    "initial_data": {"scope": "ALL", "value": 1},
+                }
+            }
+        }
+
+    run = await create_signal_request(payload("RUN"))
+    fyi = await create_signal_request(payload("FYI"))
+    sync = await create_signal_request(payload("SYNC"))
+
+    assert run.WhichOneof("payload") == "run_data"
+    assert run.run_data["data"]["value"] == 1
+    assert fyi.WhichOneof("payload") == "fyi_data"
+    assert fyi.fyi_data["data"]["value"] == 1
+    assert sync.WhichOneof("payload") == "sync"
+    assert sync.sync.scope == pb2.SyncScope.ALL
+
+
+def test_create_sync_payload_agent_uuids():
+    """Test that string UUIDs pass through and UUID objects are stringified"""
+    agent_uuid = uuid.uuid4()
+    payload = create_sync_payload(
+        {"scope": "specific", "agent_uuids": ["uuid1", agent_uuid]}
+    )
+
+    assert payload.scope == pb2.SyncScope.SPECIFIC
+    assert list(payload.agent_uuids) == ["uuid1", str(agent_uuid)]
+
+
+def test_sanitized_log_argument_is_lazy(caplog):
+    """Test that payloads are only sanitized when the log record is emitted"""
+    payload = {"data": {"record": {"name": "bad\u0000name"}}}
+
+    with patch("src.lib.sanitize_data", wraps=sanitize_data) as mock_sanitize:
+        with caplog.at_level(logging.INFO, logger="portico-bridge"):
+            logging.getLogger("portico-bridge").debug("%s", _Sanitized(payload))
+        mock_sanitize.assert_not_called()
+
+        with caplog.at_level(logging.DEBUG, logger="portico-bridge"):
+            logging.getLogger("portico-bridge").debug("%s", _Sanitized(payload))
+        mock_sanitize.assert_called_with(payload)
+
+    assert "badname" in caplog.text
+    assert payload["data"]["record"]["name"] == "bad\u0000name"
+
+
+@pytest.mark.asyncio
+async def test_agent_handlers_short_circuit_on_missing_record():
+    """Test that incomplete agent payloads never reach the sanitizer or the engine"""
+    client = MagicMock()
+    client.stub = AsyncMock()
+
+    with patch("src.lib.sanitize_data") as mock_sanitize:
+        await handle_agent_insert({"data": {}}, client)
+        await handle_agent_delete({"data": {"record": {"name": "no id"}}}, client)
+
+    mock_sanitize.assert_not_called()
+    client.stub.CreateAgent.assert_not_called()
+    client.stub.DeleteAgent.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_signal_batch_streams_valid_requests():
+    """Test that a batch goes out as one ProcessSignalBatch call, skipping bad rows"""
+    mock_stub = AsyncMock()
+    mock_stub.ProcessSignalBatch.return_value = pb2.SignalBatchResponse(
+        success=False,
+        message="Processed 2 signals (1 failed)",
+        responses=[
+            pb2.SignalResponse(success=True, runtime_session_uuid="rts-1"),
+            pb2.SignalResponse(success=False, message="Agent not found"),
+        ],
+    )
+    client = BridgeClient("localhost", 50051)
+    client.stub = mock_stub
+
+    def record(signal_id, signal_type="RUN"):
+        return {
+            "data": {
+                "record": {
+                    "id": signal_id,
+                    "agent_id": 1,
+                    "signal_type": signal_type,
+                    "initial_data": {"value": signal_id},
+                }
+            }
+        }
+
+    batch = [record(1), record(2, "NOT_A_TYPE"), record(3, "FYI")]
+    assert await client.send_signal_batch(batch) == [True, False, False]
+
+    mock_stub.ProcessSignalBatch.assert_awaited_once()
+    sent = list(mock_stub.ProcessSignalBatch.await_args.args[0])
+    assert [r.signal_id for r in sent] == [1, 3]
+
+
+def test_is_handled_signal():
+    """Test that only rows with a known signal_type pass the pre-filter"""
+
+    def payload(signal_type):
+        return {"data": {"record": {"id": 1, "signal_type": signal_type}}}
+
+    assert is_handled_signal(payload("run"))
+    assert is_handled_signal(payload("SYNC"))
+    assert not is_handled_signal(payload("UNKNOWN"))
+    assert not is_handled_signal(payload(None))
+    assert not is_handled_signal({"data": {}})
@@ -8,13 +8,17 @@ Usage:
     python -m src.test_client run     # Send a run signal
     python -m src.test_client sync    # Send a sync signal
     python -m src.test_client fyi     # Send a FYI signal
+
+    # Load test: insert 500 run signals, at most 20 inserts in flight
+    python -m src.test_client run --count 500 --concurrency 20
 """
 
 import os
 import sys
-import json
+import argparse
 import uuid
 import asyncio
+import orjson
 from datetime import datetime
 from dotenv import load_dotenv
 from supabase import create_async_client
@@ -44,7 +48,7 @@ async def insert_test_signal(client, signal_type, payload=None):
 
     if len(response.data) > 0:
         print(f"Successfully inserted {signal_type} signal with UUID: {signal_uuid}")
-        print(f"Data: {json.dumps(payload, indent=2)}")
+        print(f"Data: {orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()}")
         return signal_uuid
     else:
         print(f"Failed to insert signal: {response.error}")
@@ -93,9 +97,40 @@ async def create_fyi_signal(client):
     return await insert_test_signal(client, "FYI", fyi_payload)
 
 
+SIGNAL_CREATORS = {
+    "run": create_run_signal,
+    "sync": create_sync_signal,
+    "fyi": create_fyi_signal,
+}
+
+
+async def create_signals(client, create_signal, count, concurrency):
+    """Insert `count` signals with at most `concurrency` inserts in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create_bounded():
+        async with semaphore:
+            return await create_signal(client)
+
+    results = await asyncio.gather(*(create_bounded() for _ in range(count)))
+    inserted = sum(result is not None for result in results)
+    print(f"Inserted {inserted}/{count} signals")
+    return inserted
+
+
 async def main():
     """Main function"""
 
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("signal_type", choices=SIGNAL_CREATORS, type=str.lower)
+    parser.add_argument(
+        "--count", type=int, default=1, help="number of signals to insert"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="maximum inserts in flight"
+    )
+    args = parser.parse_args()
+
     if not load_dotenv():
         print("Failed to load .env file. Make sure it exists in the project root.")
         return 1
@@ -111,24 +146,15 @@ async def main():
     # Initialize Supabase client
     client = await create_async_client(supabase_url, supabase_key)
 
-    # Get the signal type from command line
-    if len(sys.argv) < 2:
-        print("Please specify a signal type: run, sync, or fyi")
-        return 1
-
-    signal_type = sys.argv[1].lower()
+    create_signal = SIGNAL_CREATORS[args.signal_type]
 
     try:
-        if signal_type == "run":
-            await create_run_signal(client)
-        elif signal_type == "sync":
-            await create_sync_signal(client)
-        elif signal_type == "fyi":
-            await create_fyi_signal(client)
+        if args.count == 1:
+            await create_signal(client)
         else:
-            print(f"Unknown signal type: {signal_type}")
-            print("Please specify one of: run, sync, or fyi")
-            return 1
+            await create_signals(
+                client, create_signal, args.count, max(1, args.concurrency)
+            )
     except Exception as e:
         print(f"Error: {e}")
         return 1
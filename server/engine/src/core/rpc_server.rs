@@ -1,13 +1,16 @@
 use crate::core::agent_manager::AgentManager;
 use crate::proto::bridge_service_server::{BridgeService, BridgeServiceServer};
 use crate::proto::{
-    CreateAgentRequest, DeleteAgentRequest, GeneralResponse, ServerInitRequest, SignalRequest,
-    SignalResponse,
+    CreateAgentRequest, DeleteAgentRequest, GeneralResponse, ServerInitRequest,
+    SignalBatchResponse, SignalRequest, SignalResponse,
 };
 use crate::SharedAgentMap;
 use sqlx::PgPool;
 use std::sync::Arc;
-use tonic::{Request, Response, Status};
+use tonic::{Request, Response, Status, Streaming};
+
+// Largest request the bridge may send (agent records can be big)
+const MAX_MESSAGE_BYTES: usize = 64 * 1024 * 1024;
 
 // Bridge service implementation
 pub struct RpcServer {
@@ -34,7 +37,8 @@ impl RpcServer {
     }
 
     pub fn with_server(self) -> BridgeServiceServer<Self> {
-        BridgeServiceServer::new(self)
+        // Must match the bridge's channel message limits (`_MAX_MESSAGE_BYTES`)
+        BridgeServiceServer::new(self).max_decoding_message_size(MAX_MESSAGE_BYTES)
     }
 }
 
@@ -79,6 +83,56 @@ impl BridgeService for RpcServer {
         }
     }
 
+    async fn process_signal_batch(
+        &self,
+        request: Request<Streaming<SignalRequest>>,
+    ) -> Result<Response<SignalBatchResponse>, Status> {
+        let mut stream = request.into_inner();
+        let mut responses = Vec::new();
+        let mut failed = 0;
+
+        while let Some(signal) = stream.message().await? {
+            println!(
+                "[INFO] Received batched signal: type={:?}, signal_id={}",
+                signal.signal_type(),
+                signal.signal_id
+            );
+
+            // Lock per signal so other RPCs can interleave with a long batch
+            let signal_id = signal.signal_id;
+            let mut manager = self.agent_manager.lock().await;
+            // Every signal gets exactly one response, in request order, so the
+            // bridge can report each one the way it does for `process_signal`
+            let response = match manager.process_signal(signal).await {
+                Ok(response) => response,
+                Err(status) => SignalResponse {
+                    success: false,
+                    message: status.message().to_string(),
+                    runtime_session_uuid: String::new(),
+                    result_data: None,
+                },
+            };
+            if !response.success {
+                eprintln!(
+                    "[ERROR] Batched signal {} failed: {}",
+                    signal_id, response.message
+                );
+                failed += 1;
+            }
+            responses.push(response);
+        }
+
+        Ok(Response::new(SignalBatchResponse {
+            success: failed == 0,
+            message: format!(
+                "Processed {} signals ({} failed)",
+                responses.len(),
+                failed
+            ),
+            responses,
+        }))
+    }
+
     async fn create_agent(
         &self,
         request: Request<CreateAgentRequest>,
@@ -1,6 +1,7 @@
 use crate::core::agent_manager::AgentManager;
 use crate::proto::{SignalRequest, SignalResponse};
 use crate::proto_struct_to_json;
+use serde_json::{json, Value};
 use tonic::Status;
 
 // FYI operation handler
@@ -9,13 +10,25 @@ pub async fn handle_fyi(
     signal: &SignalRequest,
     runtime_session_uuid: String,
 ) -> Result<SignalResponse, Status> {
-    if let Some(crate::proto::signal_request::Payload::FyiData(fyi_data)) = &signal.payload {
+    // Convert the data to JSON for processing; raw JSON payloads are decoded directly
+    let fyi_json = match &signal.payload {
+        Some(crate::proto::signal_request::Payload::FyiData(fyi_data)) => {
+            Some(proto_struct_to_json(fyi_data))
+        }
+        // Any JSON value is accepted, wrapped like the Struct payload's `{"data": ...}`
+        Some(crate::proto::signal_request::Payload::RawJsonData(raw)) => {
+            let data = serde_json::from_slice::<Value>(raw).map_err(|e| {
+                Status::invalid_argument(format!("Invalid JSON in FYI data: {}", e))
+            })?;
+            Some(json!({ "data": data }))
+        }
+        _ => None,
+    };
+
+    if let Some(fyi_json) = fyi_json {
         // Handle the FYI data
         println!("[INFO] Received FYI data signal: {}", signal.signal_id);
 
-        // Convert the data to JSON for processing
-        let fyi_json = proto_struct_to_json(fyi_data);
-
         // Log any associated agent info
         if signal.agent_id != 0 {
             println!("[INFO] FYI related to agent: {}", signal.agent_id);
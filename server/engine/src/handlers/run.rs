@@ -1,5 +1,8 @@
 use crate::core::agent_manager::AgentManager;
+use crate::proto::signal_request::Payload;
 use crate::proto::{SignalRequest, SignalResponse};
+use crate::{json_to_proto_struct, raw_json_to_object};
+use serde_json::json;
 use tonic::Status;
 
 // Run operation handler
@@ -14,6 +17,20 @@ pub async fn handle_run(
         signal.signal_id
     );
 
+    // Validate raw JSON here so a bad payload fails this call instead of being
+    // dropped later by the agent worker, and hand the worker the same
+    // `{"data": ...}` Struct that structured payloads carry
+    let mut signal = signal;
+    let raw_data = match &signal.payload {
+        Some(Payload::RawJsonData(raw)) => Some(raw_json_to_object(raw).map_err(|e| {
+            Status::invalid_argument(format!("Invalid JSON in run data: {}", e))
+        })?),
+        _ => None,
+    };
+    if let Some(data) = raw_data {
+        signal.payload = Some(Payload::RunData(json_to_proto_struct(&json!({ "data": data }))));
+    }
+
     let agent_uuid_or_id = signal.agent_id.to_string();
 
     if agent_uuid_or_id.is_empty() {
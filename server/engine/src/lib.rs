@@ -29,6 +29,15 @@ pub fn proto_struct_to_json(proto_struct: &Struct) -> Value {
     Value::Object(map)
 }
 
+// Decode a raw JSON signal payload; like a Struct payload it must be an object
+pub fn raw_json_to_object(raw: &[u8]) -> Result<Value, String> {
+    match serde_json::from_slice::<Value>(raw) {
+        Ok(value @ Value::Object(_)) => Ok(value),
+        Ok(_) => Err("expected a JSON object".to_string()),
+        Err(e) => Err(e.to_string()),
+    }
+}
+
 // Convert a serde_json::Value to a protobuf Struct
 pub fn json_to_proto_struct(json_value: &Value) -> prost_types::Struct {
     if let Value::Object(map) = json_value {
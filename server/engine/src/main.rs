@@ -5,6 +5,7 @@ use std::collections::HashMap;
 use std::env;
 use std::net::SocketAddr;
 use std::sync::Arc;
+use std::time::Duration;
 use tokio::sync::RwLock;
 use tonic::transport::Server;
 
@@ -54,7 +55,11 @@ async fn main() -> Result<()> {
 
     // Start the gRPC server
     println!("Starting gRPC server with agent queuing support...");
+    // Bridge traffic is small request/response messages, so don't let Nagle hold them back,
+    // and keep idle bridge connections from being silently dropped
     Server::builder()
+        .tcp_nodelay(true)
+        .tcp_keepalive(Some(Duration::from_secs(60)))
         .add_service(bridge_service.with_server())
         .serve(addr)
         .await?;